@@ -1,7 +1,13 @@
+import gc
+import hashlib
 import json
+import joblib
+import os
+import re
+import orjson
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
 from sklearn.metrics import classification_report
 from datetime import datetime
 
@@ -31,30 +37,56 @@ CROSS_VALIDATE = False
 # Lower = More Bots Caught (Risky, chases +4 reward)
 CONFIDENCE_THRESHOLD = 0.55 
 
+# CLASSIFIER: 'rf' = Random Forest (exported to public/rf_model.json for the browser)
+#             'hgb' = HistGradientBoosting on binned features (faster fit/predict, Python scores only)
+CLASSIFIER = 'rf'
+
 # OUTPUTS
 TEAM_NAME = "MyTeam"
 LANG = "en" 
 
+# CACHING: Per-user features are saved as Parquet in CACHE_DIR, keyed on the input files' contents.
+# Reruns on unchanged data skip JSON parsing and feature extraction.
+# Delete the folder after editing extract_features so stale features aren't reused.
+USE_FEATURE_CACHE = True
+CACHE_DIR = '.cache'
+
+# REUSE_MODEL: Save fitted classifiers to CACHE_DIR and reload them (memory-mapped) instead of
+# refitting when the training features, labels and classifier settings are unchanged.
+REUSE_MODEL = False
+
 
 # ==========================================
 # 2. DATA LOADING
 # ==========================================
 
+def posts_frame(posts):
+    """DataFrame for one file's posts, with text/author_id as Arrow-backed strings
+    (lower memory, and .str kernels run in Arrow instead of on Python objects)."""
+    df = pd.DataFrame(posts)
+    for col in ('text', 'author_id'):
+        if col in df:
+            df[col] = df[col].astype('string[pyarrow]')
+    return df
+
 def load_data(json_paths, bot_txt_paths=None):
-    all_posts = []
+    frames = []
     bot_ids = set()
 
     if isinstance(json_paths, str): json_paths = [json_paths]
     for path in json_paths:
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict) and 'posts' in data:
-                    all_posts.extend(data['posts'])
-                elif isinstance(data, list):
-                    all_posts.extend(data)
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
         except FileNotFoundError:
             print(f"File not found: {path}")
+            continue
+        # One frame per file, so each parsed document can be freed before the next is read
+        if isinstance(data, dict) and 'posts' in data:
+            frames.append(posts_frame(data['posts']))
+        elif isinstance(data, list):
+            frames.append(posts_frame(data))
+        del data
 
     if bot_txt_paths:
         if isinstance(bot_txt_paths, str): bot_txt_paths = [bot_txt_paths]
@@ -65,104 +97,220 @@ def load_data(json_paths, bot_txt_paths=None):
             except FileNotFoundError:
                 pass
 
-    return pd.DataFrame(all_posts), bot_ids
+    df_posts = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    return df_posts, frozenset(bot_ids)
 
 # ==========================================
 # 3. FEATURE ENGINEERING (AGGRESSIVE)
 # ==========================================
 
+# Post timestamps in the challenge datasets, e.g. 2024-03-16T00:00:08.000Z
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+
+TRIGGER_WORDS = ['check my bio', 'follow me', 'click', 'free', 'giveaway', 
+                 'win', 'bet', 'stream', 'live', 'crypto', 'nft', 'limited time',
+                 'official', 'update', 'breaking', 'news', 'alert'] # Added news/sports triggers
+
+# One scan for all triggers. The lookahead matches every position where a trigger starts,
+# so overlapping triggers ("newstream" = news + stream) count like separate str.count calls.
+TRIGGER_RE = re.compile('(?=(?:' + '|'.join(re.escape(w) for w in TRIGGER_WORDS) + '))')
+
+def temporal_stats(authors, times):
+    """Per-author posting-gap std (ddof=1) and min in seconds, plus active hours and max posts in one hour.
+
+    Expects posts sorted by (author, time). Each author is a contiguous block, so every
+    reduction is one numpy reduceat over the block offsets instead of a pandas call per user.
+    """
+    codes, uniques = pd.factorize(authors)
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(codes)])
+
+    gaps = times.diff().dt.total_seconds().to_numpy(dtype=np.float64, copy=True)
+    gaps[starts] = np.nan  # first post of each author has no previous post
+    valid = ~np.isnan(gaps)
+    n_gaps = np.add.reduceat(valid, starts)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.add.reduceat(np.where(valid, gaps, 0.0), starts) / n_gaps
+        dev = np.where(valid, gaps - np.repeat(mean, sizes), 0.0)
+        std = np.sqrt(np.add.reduceat(dev * dev, starts) / (n_gaps - 1))
+    std[n_gaps < 2] = np.nan  # matches pandas .std() on fewer than two gaps
+
+    # Hours only take 24 values: one bincount gives every author's hour histogram
+    hours = times.dt.hour.to_numpy(dtype=np.float64)
+    has_hour = ~np.isnan(hours)
+    hist = np.bincount(codes[has_hour] * 24 + hours[has_hour].astype(np.int64),
+                       minlength=len(uniques) * 24).reshape(len(uniques), 24)
+
+    return pd.DataFrame({
+        'time_std_dev': std,
+        'min_time_gap': np.fmin.reduceat(gaps, starts),
+        'active_hour_count': (hist > 0).sum(axis=1),
+        'max_tweets_one_hour': hist.max(axis=1),
+    }, index=uniques)
+
 def extract_features(df_posts):
     print(f"Extracting features for {df_posts['author_id'].nunique()} users...")
     
-    df_posts['created_at'] = pd.to_datetime(df_posts['created_at'])
-    df_posts['hour'] = df_posts['created_at'].dt.hour
+    # Explicit format skips per-row format inference; fall back to generic ISO 8601 if a file deviates
+    try:
+        df_posts['created_at'] = pd.to_datetime(df_posts['created_at'], format=TIMESTAMP_FORMAT, utc=True, cache=True)
+    except ValueError:
+        df_posts['created_at'] = pd.to_datetime(df_posts['created_at'], format='ISO8601', utc=True)
     df_posts['text_len'] = df_posts['text'].str.len().fillna(0)
     
-    user_features = []
+    # One groupby for every user; all aggregations below run in pandas, not per user
+    g = df_posts.groupby('author_id')
+    total_tweets = g.size()
+    multi_post = total_tweets > 1
+    stats = pd.DataFrame(index=total_tweets.index)
+
+    # Posts joined per user exactly like rfModel.ts, so phrases spanning two posts still count
+    full_text = df_posts['text'].fillna("").groupby(df_posts['author_id']).agg(" ".join).str.lower()
     
-    for author_id, group in df_posts.groupby('author_id'):
-        stats = {'author_id': author_id}
-        
-        texts = group['text'].fillna("").tolist()
-        total_tweets = len(texts)
-        full_text = " ".join(texts).lower()
-        
-        # --- 1. CONTENT ENTROPY (Catch the "Smart" Bots) ---
-        # Humans use many unique words. Bots recycle the same vocabulary.
-        all_words = full_text.split()
-        total_words = len(all_words)
-        unique_words = len(set(all_words))
-        
-        # Avoid division by zero
-        if total_words > 0:
-            stats['vocab_diversity'] = unique_words / total_words
-        else:
-            stats['vocab_diversity'] = 0
-            
-        # Repetition (Classic)
-        unique_texts = group['text'].nunique()
-        stats['repetition_ratio'] = 1.0 - (unique_texts / total_tweets)
-        
-        # --- 2. STRUCTURAL FEATURES ---
-        # Variance in tweet length (Bots = 0 std dev, Humans = high std dev)
-        stats['text_len_std'] = group['text_len'].std() if total_tweets > 1 else 0
-        stats['avg_text_len'] = group['text_len'].mean()
-        
-        # Punctuation usage (Bots often under-use or strictly use punctuation)
-        punct_count = full_text.count('!') + full_text.count('?') + full_text.count('.')
-        stats['punct_density'] = punct_count / total_tweets
+    # --- 1. CONTENT ENTROPY (Catch the "Smart" Bots) ---
+    # Humans use many unique words. Bots recycle the same vocabulary.
+    all_words = full_text.str.split()
+    total_words = all_words.str.len()
+    # One row per word (users with no words become NaN, which nunique skips).
+    # Exploded on positional keys: grouping by small ints is ~2x cheaper than by author-id strings.
+    words = all_words.reset_index(drop=True).explode()
+    unique_words = pd.Series(words.groupby(level=0).nunique().to_numpy(), index=all_words.index)
+    del all_words, words  # per-user word lists are the largest intermediate
+    
+    # Avoid division by zero
+    stats['vocab_diversity'] = (unique_words / total_words).where(total_words > 0, 0)
         
-        # --- 3. SPAM TRIGGERS (Expanded) ---
-        triggers = ['check my bio', 'follow me', 'click', 'free', 'giveaway', 
-                    'win', 'bet', 'stream', 'live', 'crypto', 'nft', 'limited time',
-                    'official', 'update', 'breaking', 'news', 'alert'] # Added news/sports triggers
-        stats['trigger_word_density'] = sum(full_text.count(w) for w in triggers) / total_tweets
+    # Repetition (Classic)
+    stats['repetition_ratio'] = 1.0 - (g['text'].nunique() / total_tweets)
+    
+    # --- 2. STRUCTURAL FEATURES ---
+    # Variance in tweet length (Bots = 0 std dev, Humans = high std dev)
+    stats['text_len_std'] = g['text_len'].std().where(multi_post, 0)
+    stats['avg_text_len'] = g['text_len'].mean()
+    
+    # Punctuation usage (Bots often under-use or strictly use punctuation)
+    stats['punct_density'] = full_text.str.count(r'[!?.]') / total_tweets
+    
+    # --- 3. SPAM TRIGGERS (Expanded) ---
+    stats['trigger_word_density'] = full_text.str.count(TRIGGER_RE) / total_tweets
+    
+    # Counts every 'http', not posts-with-links, to match countSubstring in rfModel.ts
+    stats['link_density'] = full_text.str.count('http') / total_tweets
+    stats['mention_density'] = full_text.str.count('@') / total_tweets
+    stats['hashtag_density'] = full_text.str.count('#') / total_tweets
+    del full_text
+
+    # --- 4. TEMPORAL FEATURES ---
+    # Single-post users get the same sentinels as before (-1 gaps, 1 active hour)
+    # Sort only the two columns needed instead of copying every post's text
+    sorted_posts = df_posts.loc[df_posts['author_id'].notna(), ['author_id', 'created_at']].sort_values(['author_id', 'created_at'])
+    temporal = temporal_stats(sorted_posts['author_id'], sorted_posts['created_at'])
+    
+    stats['time_std_dev'] = temporal['time_std_dev'].where(multi_post, -1)
+    stats['min_time_gap'] = temporal['min_time_gap'].where(multi_post, -1)
+    stats['active_hour_count'] = temporal['active_hour_count'].where(multi_post, 1)
+    stats['max_tweets_one_hour'] = temporal['max_tweets_one_hour'].where(multi_post, 1)
+
+    stats['total_posts'] = total_tweets
         
-        stats['link_density'] = full_text.count('http') / total_tweets
-        stats['mention_density'] = full_text.count('@') / total_tweets
-        stats['hashtag_density'] = full_text.count('#') / total_tweets
-
-        # --- 4. TEMPORAL FEATURES ---
-        if total_tweets > 1:
-            sorted_times = group['created_at'].sort_values()
-            deltas = sorted_times.diff().dropna().dt.total_seconds()
-            
-            stats['time_std_dev'] = deltas.std()
-            stats['min_time_gap'] = deltas.min()
-            stats['active_hour_count'] = group['hour'].nunique()
-            stats['max_tweets_one_hour'] = group['hour'].value_counts().max()
-        else:
-            stats['time_std_dev'] = -1
-            stats['min_time_gap'] = -1
-            stats['active_hour_count'] = 1
-            stats['max_tweets_one_hour'] = 1
-
-        stats['total_posts'] = total_tweets
-        user_features.append(stats)
+    # Arrow string kernels return nullable Int64/Float64; hand sklearn plain numpy floats
+    nullable = [col for col in stats.columns if isinstance(stats[col].dtype, pd.Float64Dtype)]
+    stats = stats.astype(dict.fromkeys(nullable, 'float64'))
         
-    return pd.DataFrame(user_features).fillna(0)
+    return stats.reset_index().fillna(0)
 
 # ==========================================
 # 4. EXECUTION
 # ==========================================
 
-def run_single(train_json, train_bots, test_json, test_bots, features):
-    """Train on one dataset, predict on another. Returns (X_test_df, test_bot_ids)."""
-    df_raw_train, train_bot_ids = load_data(train_json, train_bots)
-    X_train_df = extract_features(df_raw_train)
-    y_train = X_train_df['author_id'].apply(lambda x: 1 if x in train_bot_ids else 0)
+def cache_key(paths):
+    """Short SHA-1 over the contents of the given files (missing files hash by name only)."""
+    h = hashlib.sha1()
+    for path in paths:
+        h.update(path.encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+        except FileNotFoundError:
+            h.update(b'<missing>')
+    return h.hexdigest()[:12]
+
+
+def load_features(json_paths, bot_txt_paths=None):
+    """load_data + extract_features, cached as Parquet. Returns (features_df, bot_ids)."""
+    if not USE_FEATURE_CACHE:
+        df_posts, bot_ids = load_data(json_paths, bot_txt_paths)
+        X_df = extract_features(df_posts)
+        del df_posts; gc.collect()  # raw posts aren't needed once features exist
+        return X_df, bot_ids
+
+    if isinstance(json_paths, str): json_paths = [json_paths]
+    if isinstance(bot_txt_paths, str): bot_txt_paths = [bot_txt_paths]
+    key = cache_key(list(json_paths) + list(bot_txt_paths or []))
+    features_path = os.path.join(CACHE_DIR, f'features_{key}.parquet')
+    bots_path = os.path.join(CACHE_DIR, f'features_{key}.bots.json')
+
+    if os.path.exists(features_path) and os.path.exists(bots_path):
+        with open(bots_path, 'rb') as f:
+            bot_ids = frozenset(orjson.loads(f.read()))
+        print(f"Loaded cached features -> {features_path}")
+        return pd.read_parquet(features_path, engine='pyarrow'), bot_ids
+
+    df_posts, bot_ids = load_data(json_paths, bot_txt_paths)
+    X_df = extract_features(df_posts)
+    del df_posts; gc.collect()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    X_df.to_parquet(features_path, engine='pyarrow', compression='zstd', index=False)
+    with open(bots_path, 'wb') as f:
+        f.write(orjson.dumps(sorted(bot_ids)))
+
+    return X_df, bot_ids
+
 
-    clf = RandomForestClassifier(n_estimators=200, max_depth=15, class_weight='balanced', random_state=42)
-    clf.fit(X_train_df[features], y_train)
+def make_classifier():
+    """Build the estimator selected by CLASSIFIER."""
+    if CLASSIFIER == 'hgb':
+        return HistGradientBoostingClassifier(max_iter=300, max_depth=8, learning_rate=0.05,
+                                              l2_regularization=1.0, class_weight='balanced', random_state=42)
+    return RandomForestClassifier(n_estimators=200, max_depth=15, class_weight='balanced', random_state=42, n_jobs=-1)
 
-    df_raw_test, test_bot_ids = load_data(test_json, test_bots)
-    X_test_df = extract_features(df_raw_test)
 
-    probs = clf.predict_proba(X_test_df[features])[:, 1]
+def fit_classifier(X_train, y_train):
+    """Fit make_classifier() on X_train (float32), or reload the identical fit from CACHE_DIR when REUSE_MODEL is on."""
+    clf = make_classifier()
+    if not REUSE_MODEL:
+        return clf.fit(X_train, y_train)
+
+    h = hashlib.sha1(repr(sorted(clf.get_params().items())).encode('utf-8'))
+    h.update(np.ascontiguousarray(X_train).tobytes())
+    h.update(np.asarray(y_train, dtype=np.int8).tobytes())
+    model_path = os.path.join(CACHE_DIR, f'{CLASSIFIER}_{h.hexdigest()[:12]}.joblib')
+
+    if os.path.exists(model_path):
+        print(f"Loaded cached model -> {model_path}")
+        return joblib.load(model_path, mmap_mode='r')
+
+    clf.fit(X_train, y_train)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    joblib.dump(clf, model_path)  # uncompressed, so the tree arrays can be memory-mapped on load
+    return clf
+
+
+def fit_predict(X_train_df, y_train, X_test_df, features):
+    """Train on one feature table, predict on another. Adds prob_bot/pred_bot to X_test_df and returns it."""
+    clf = fit_classifier(X_train_df[features].to_numpy(dtype=np.float32), y_train)
+
+    probs = clf.predict_proba(X_test_df[features].to_numpy(dtype=np.float32))[:, 1]
+    # Release this fold's forest before the next fold fits its own
+    del clf; gc.collect()
     X_test_df['prob_bot'] = probs
-    X_test_df['pred_bot'] = (probs >= CONFIDENCE_THRESHOLD).astype(int)
+    X_test_df['pred_bot'] = (probs >= CONFIDENCE_THRESHOLD).astype(np.int8)
 
-    return X_test_df, test_bot_ids
+    return X_test_df
 
 
 def merge_datasets(json_paths, bot_paths, output_json, output_bots):
@@ -174,8 +322,8 @@ def merge_datasets(json_paths, bot_paths, output_json, output_bots):
     meta = {}
 
     for path in json_paths:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
         if not meta:
             meta = {k: v for k, v in data.items() if k not in ('posts', 'users')}
         merged_posts.extend(data.get('posts', []))
@@ -197,8 +345,8 @@ def merge_datasets(json_paths, bot_paths, output_json, output_bots):
         'users': merged_users,
     }
 
-    with open(output_json, 'w', encoding='utf-8') as f:
-        json.dump(merged_dataset, f)
+    with open(output_json, 'wb') as f:
+        f.write(orjson.dumps(merged_dataset))
     print(f"[DONE] Merged dataset → {output_json} ({len(merged_users)} users, {len(merged_posts)} posts)")
 
     with open(output_bots, 'w') as f:
@@ -229,7 +377,6 @@ def export_model_json(clf, features, output_path='public/rf_model.json'):
         'trees': trees
     }
 
-    import os
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     with open(output_path, 'w') as f:
         json.dump(model, f, separators=(',', ':'))  # compact JSON
@@ -252,36 +399,35 @@ def main():
         # Merge all python scores + datasets for weight optimization
         print("=== CROSS-VALIDATION MODE ===\n")
 
+        # Each dataset is loaded and featurized once, then reused as train or test per fold
+        X_30, bots_30 = load_features('practice_data/dataset.posts&users.30.json', 'practice_data/dataset.bots.30.txt')
+        X_32, bots_32 = load_features('practice_data/dataset.posts&users.32.json', 'practice_data/dataset.bots.32.txt')
+        # Labels are built once per dataset and shared by its training fold and its scoring
+        y_30 = X_30['author_id'].isin(bots_30).astype(np.int8)
+        y_32 = X_32['author_id'].isin(bots_32).astype(np.int8)
+
         print("--- Fold 1: Train on 32, Predict 30 ---")
-        df_30, bots_30 = run_single(
-            'practice_data/dataset.posts&users.32.json', 'practice_data/dataset.bots.32.txt',
-            'practice_data/dataset.posts&users.30.json', 'practice_data/dataset.bots.30.txt',
-            features
-        )
+        df_30 = fit_predict(X_32, y_32, X_30, features)
 
         print("\n--- Fold 2: Train on 30, Predict 32 ---")
-        df_32, bots_32 = run_single(
-            'practice_data/dataset.posts&users.30.json', 'practice_data/dataset.bots.30.txt',
-            'practice_data/dataset.posts&users.32.json', 'practice_data/dataset.bots.32.txt',
-            features
-        )
+        df_32 = fit_predict(X_30, y_30, X_32, features)
 
         # Merge python scores from both folds
+        # .tolist() converts whole columns at once instead of boxing Series elements one by one
         prob_map = {}
-        prob_map.update(dict(zip(df_30['author_id'], df_30['prob_bot'])))
-        prob_map.update(dict(zip(df_32['author_id'], df_32['prob_bot'])))
+        for df in (df_30, df_32):
+            prob_map.update(zip(df['author_id'].to_numpy().tolist(), df['prob_bot'].to_numpy().tolist()))
 
-        with open('public/python_scores.json', 'w') as f:
-            json.dump(prob_map, f)
+        with open('public/python_scores.json', 'wb') as f:
+            f.write(orjson.dumps(prob_map))
         print(f"\n[DONE] Saved public/python_scores.json ({len(prob_map)} users from both datasets)")
 
         # Score both folds
-        for label, df, bot_ids in [("Dataset 30", df_30, bots_30), ("Dataset 32", df_32, bots_32)]:
-            y_test = df['author_id'].apply(lambda x: 1 if x in bot_ids else 0)
+        for label, df, y_test in [("Dataset 30", df_30, y_30), ("Dataset 32", df_32, y_32)]:
             y_pred = df['pred_bot']
-            tp = np.sum((y_test == 1) & (y_pred == 1))
-            fn = np.sum((y_test == 1) & (y_pred == 0))
-            fp = np.sum((y_test == 0) & (y_pred == 1))
+            tp = int((y_test & y_pred).sum())
+            fn = int(y_test.sum()) - tp
+            fp = int(y_pred.sum()) - tp
             score = (4 * tp) - (1 * fn) - (2 * fp)
             print(f"{label}: TP={tp} FP={fp} FN={fn} Score={score}")
 
@@ -298,28 +444,29 @@ def main():
     print("--- TRAINING (AGGRESSIVE MODE) ---")
 
     # Train and export model for browser inference
-    df_raw_train, train_bot_ids = load_data(TRAIN_JSON_FILES, TRAIN_BOT_FILES)
-    X_train_df = extract_features(df_raw_train)
-    y_train = X_train_df['author_id'].apply(lambda x: 1 if x in train_bot_ids else 0)
+    X_train_df, train_bot_ids = load_features(TRAIN_JSON_FILES, TRAIN_BOT_FILES)
+    y_train = X_train_df['author_id'].isin(train_bot_ids).astype(np.int8)
 
-    clf = RandomForestClassifier(n_estimators=200, max_depth=15, class_weight='balanced', random_state=42)
-    clf.fit(X_train_df[features], y_train)
-    export_model_json(clf, features)
+    # Trees split on float32 internally; passing float32 avoids a converted copy of X
+    clf = fit_classifier(X_train_df[features].to_numpy(dtype=np.float32), y_train)
+    if CLASSIFIER == 'rf':
+        export_model_json(clf, features)
+    else:
+        print("[SKIP] rf_model.json export needs CLASSIFIER = 'rf' (browser only runs Random Forests)")
 
     # Predict on test set
-    df_raw_test, test_bot_ids = load_data(TEST_JSON_FILE, TEST_BOT_FILE)
-    X_test_df = extract_features(df_raw_test)
-    probs = clf.predict_proba(X_test_df[features])[:, 1]
+    X_test_df, test_bot_ids = load_features(TEST_JSON_FILE, TEST_BOT_FILE)
+    probs = clf.predict_proba(X_test_df[features].to_numpy(dtype=np.float32))[:, 1]
     X_test_df['prob_bot'] = probs
-    X_test_df['pred_bot'] = (probs >= CONFIDENCE_THRESHOLD).astype(int)
+    X_test_df['pred_bot'] = (probs >= CONFIDENCE_THRESHOLD).astype(np.int8)
 
     # SCORING
     if test_bot_ids:
-        y_test = X_test_df['author_id'].apply(lambda x: 1 if x in test_bot_ids else 0)
+        y_test = X_test_df['author_id'].isin(test_bot_ids).astype(np.int8)
         y_pred = X_test_df['pred_bot']
-        tp = np.sum((y_test == 1) & (y_pred == 1))
-        fn = np.sum((y_test == 1) & (y_pred == 0))
-        fp = np.sum((y_test == 0) & (y_pred == 1))
+        tp = int((y_test & y_pred).sum())
+        fn = int(y_test.sum()) - tp
+        fp = int(y_pred.sum()) - tp
         score = (4 * tp) - (1 * fn) - (2 * fp)
         print(f"\nRESULTS (Threshold {CONFIDENCE_THRESHOLD}):")
         print(f"TP (Bots Caught):  {tp}")
@@ -328,9 +475,9 @@ def main():
         print(f"TOTAL SCORE:       {score}")
 
     # EXPORT JSON FOR REACT
-    prob_map = dict(zip(X_test_df['author_id'], X_test_df['prob_bot']))
-    with open('public/python_scores.json', 'w') as f:
-        json.dump(prob_map, f)
+    prob_map = dict(zip(X_test_df['author_id'].to_numpy().tolist(), X_test_df['prob_bot'].to_numpy().tolist()))
+    with open('public/python_scores.json', 'wb') as f:
+        f.write(orjson.dumps(prob_map))
     print("\n[DONE] Saved public/python_scores.json")
 
     # EXPORT TXT
@@ -51,7 +51,7 @@ def load_data(json_paths, bot_txt_paths=None):
             except FileNotFoundError:
                 pass
 
-    return pd.DataFrame(all_posts), bot_ids
+    return pd.DataFrame(all_posts), frozenset(bot_ids)
 
 # ==========================================
 # 3. FEATURE ENGINEERING (AGGRESSIVE)
@@ -137,7 +137,7 @@ def main():
     print("--- TRAINING (AGGRESSIVE MODE) ---")
     df_raw_train, train_bot_ids = load_data(TRAIN_JSON_FILES, TRAIN_BOT_FILES)
     X_train_df = extract_features(df_raw_train)
-    y_train = X_train_df['author_id'].apply(lambda x: 1 if x in train_bot_ids else 0)
+    y_train = X_train_df['author_id'].isin(train_bot_ids).astype(np.int8)
     
     # Feature Selection
     features = [
@@ -150,28 +150,29 @@ def main():
     # Random Forest Config
     # Increased n_estimators for stability
     # Removed max_depth to allow it to learn complex "smart bot" patterns
-    clf = RandomForestClassifier(n_estimators=500, class_weight='balanced', random_state=42)
-    clf.fit(X_train_df[features], y_train)
+    # n_jobs=-1 fits/predicts trees on all cores
+    clf = RandomForestClassifier(n_estimators=500, class_weight='balanced', random_state=42, n_jobs=-1)
+    clf.fit(X_train_df[features].to_numpy(dtype=np.float32), y_train)
 
     # 2. PREDICT
     print("\n--- PREDICTING ---")
     df_raw_test, test_bot_ids = load_data(TEST_JSON_FILE, TEST_BOT_FILE)
     X_test_df = extract_features(df_raw_test)
     
-    probs = clf.predict_proba(X_test_df[features])[:, 1]
+    probs = clf.predict_proba(X_test_df[features].to_numpy(dtype=np.float32))[:, 1]
     
     # Apply Threshold
     X_test_df['prob_bot'] = probs
-    X_test_df['pred_bot'] = (probs >= CONFIDENCE_THRESHOLD).astype(int)
+    X_test_df['pred_bot'] = (probs >= CONFIDENCE_THRESHOLD).astype(np.int8)
 
     # 3. SCORING
     if test_bot_ids:
-        y_test = X_test_df['author_id'].apply(lambda x: 1 if x in test_bot_ids else 0)
+        y_test = X_test_df['author_id'].isin(test_bot_ids).astype(np.int8)
         y_pred = X_test_df['pred_bot']
         
-        tp = np.sum((y_test == 1) & (y_pred == 1))
-        fn = np.sum((y_test == 1) & (y_pred == 0))
-        fp = np.sum((y_test == 0) & (y_pred == 1))
+        tp = int((y_test & y_pred).sum())
+        fn = int(y_test.sum()) - tp
+        fp = int(y_pred.sum()) - tp
         score = (4 * tp) - (1 * fn) - (2 * fp)
         
         print(f"\nRESULTS (Threshold {CONFIDENCE_THRESHOLD}):")